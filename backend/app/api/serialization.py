@@ -0,0 +1,28 @@
+"""
+APIレスポンスのシリアライズヘルパー
+
+response_model経由のjsonable_encoder + json.dumpsを通さず、
+pydantic-coreから直接JSONバイト列のレスポンスを生成します。
+"""
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+def adapter_json_response(adapter: TypeAdapter, payload: dict) -> Response:
+    """TypeAdapterで検証・シリアライズしたJSONレスポンスを返す
+
+    サービス層が未検証のビュー（model_constructした行など）を返す場合に使い、
+    検証はこの1回だけ行われる。
+    """
+    validated = adapter.validate_python(payload, from_attributes=True)
+    return Response(content=adapter.dump_json(validated), media_type="application/json")
+
+
+def model_json_response(model: BaseModel) -> Response:
+    """検証済みモデルを再検証せずにJSONレスポンスへシリアライズする
+
+    サービス層で検証済みのデータには adapter_json_response を使わないこと
+    （同じ行を二重に検証することになる）。
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
@@ -3,8 +3,10 @@
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Path, status
+from pydantic import TypeAdapter
 
 from app.api.dependencies import get_current_user
+from app.api.serialization import adapter_json_response
 from app.schemas.friend import (
     FriendListResponse,
     FriendRequestCreate,
@@ -19,12 +21,28 @@ from app.services.friends import FriendService
 
 router = APIRouter()
 
+# 一覧レスポンス用のTypeAdapter（モジュールロード時に1度だけ構築）
+# pydantic-coreから直接JSONバイト列を生成し、
+# jsonable_encoder + json.dumps の二重シリアライズを回避する
+_FRIEND_REQUEST_LIST_ADAPTER = TypeAdapter(FriendRequestListResponse)
+_FRIEND_LIST_ADAPTER = TypeAdapter(FriendListResponse)
+_LOCATION_SHARE_REQUEST_LIST_ADAPTER = TypeAdapter(LocationShareRequestListResponse)
+
+
+def get_friend_service() -> FriendService:
+    """フレンドサービスのDIプロバイダ
+
+    メッセージAPIと同様、テストからapp.dependency_overridesで
+    差し替えられるよう名前付きの依存関係にしています。
+    """
+    return FriendService()
+
 
 @router.post("/requests", response_model=dict, status_code=status.HTTP_201_CREATED)
 async def send_friend_request(
     request_data: FriendRequestCreate,
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     フレンドリクエストを送信
@@ -47,7 +65,8 @@ async def send_friend_request(
         return {
             "message": "フレンドリクエストを送信しました",
             "request_id": request.request_id,
-            "status": request.status.value,
+            # サービスはmodel_constructでwire値（文字列）のstatusを返す
+            "status": request.status,
         }
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -56,7 +75,7 @@ async def send_friend_request(
 @router.get("/requests/received", response_model=FriendRequestListResponse)
 async def get_received_requests(
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     受信したフレンドリクエスト一覧を取得
@@ -71,13 +90,15 @@ async def get_received_requests(
         受信したリクエスト一覧
     """
     requests = await friend_service.get_received_requests(current_user.uid)
-    return FriendRequestListResponse(requests=requests, total=len(requests))
+    return adapter_json_response(
+        _FRIEND_REQUEST_LIST_ADAPTER, {"requests": requests, "total": len(requests)}
+    )
 
 
 @router.get("/requests/sent", response_model=FriendRequestListResponse)
 async def get_sent_requests(
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     送信したフレンドリクエスト一覧を取得
@@ -92,14 +113,16 @@ async def get_sent_requests(
         送信したリクエスト一覧
     """
     requests = await friend_service.get_sent_requests(current_user.uid)
-    return FriendRequestListResponse(requests=requests, total=len(requests))
+    return adapter_json_response(
+        _FRIEND_REQUEST_LIST_ADAPTER, {"requests": requests, "total": len(requests)}
+    )
 
 
 @router.post("/requests/{request_id}/accept", response_model=dict)
 async def accept_friend_request(
     request_id: str = Path(..., description="リクエストID"),
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     フレンドリクエストを承認
@@ -132,7 +155,7 @@ async def accept_friend_request(
 async def reject_friend_request(
     request_id: str = Path(..., description="リクエストID"),
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     フレンドリクエストを拒否
@@ -160,7 +183,7 @@ async def reject_friend_request(
 @router.get("", response_model=FriendListResponse)
 async def get_friends(
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     フレンド一覧を取得
@@ -175,14 +198,14 @@ async def get_friends(
         フレンド一覧
     """
     friends = await friend_service.get_friends(current_user.uid)
-    return FriendListResponse(friends=friends, total=len(friends))
+    return adapter_json_response(_FRIEND_LIST_ADAPTER, {"friends": friends, "total": len(friends)})
 
 
 @router.get("/{friend_id}", response_model=FriendshipResponse)
 async def get_friend(
     friend_id: str = Path(..., description="フレンドのUID"),
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     特定のフレンド情報を取得
@@ -221,7 +244,7 @@ async def update_friendship(
     friend_id: str = Path(..., description="フレンドのUID"),
     update_data: FriendshipUpdate = ...,
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     フレンド関係を更新
@@ -261,7 +284,7 @@ async def update_friendship(
 async def remove_friend(
     friend_id: str = Path(..., description="フレンドのUID"),
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     フレンド関係を削除
@@ -286,7 +309,7 @@ async def remove_friend(
 async def block_user(
     friend_id: str = Path(..., description="ブロックするユーザーのUID"),
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     ユーザーをブロック
@@ -313,7 +336,7 @@ async def block_user(
 async def send_location_share_request(
     request_data: LocationShareRequestCreate,
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     位置情報共有リクエストを送信
@@ -337,7 +360,8 @@ async def send_location_share_request(
         return {
             "message": "位置情報共有リクエストを送信しました",
             "request_id": request.request_id,
-            "status": request.status.value,
+            # サービスはmodel_constructでwire値（文字列）のstatusを返す
+            "status": request.status,
         }
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -346,7 +370,7 @@ async def send_location_share_request(
 @router.get("/location-share/requests/received", response_model=LocationShareRequestListResponse)
 async def get_received_location_share_requests(
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     受信した位置情報共有リクエスト一覧を取得
@@ -361,13 +385,15 @@ async def get_received_location_share_requests(
         受信したリクエスト一覧
     """
     requests = await friend_service.get_received_location_share_requests(current_user.uid)
-    return LocationShareRequestListResponse(requests=requests, total=len(requests))
+    return adapter_json_response(
+        _LOCATION_SHARE_REQUEST_LIST_ADAPTER, {"requests": requests, "total": len(requests)}
+    )
 
 
 @router.get("/location-share/requests/sent", response_model=LocationShareRequestListResponse)
 async def get_sent_location_share_requests(
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     送信した位置情報共有リクエスト一覧を取得
@@ -382,14 +408,16 @@ async def get_sent_location_share_requests(
         送信したリクエスト一覧
     """
     requests = await friend_service.get_sent_location_share_requests(current_user.uid)
-    return LocationShareRequestListResponse(requests=requests, total=len(requests))
+    return adapter_json_response(
+        _LOCATION_SHARE_REQUEST_LIST_ADAPTER, {"requests": requests, "total": len(requests)}
+    )
 
 
 @router.post("/location-share/requests/{request_id}/accept", response_model=dict)
 async def accept_location_share_request(
     request_id: str = Path(..., description="リクエストID"),
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     位置情報共有リクエストを承認
@@ -424,7 +452,7 @@ async def accept_location_share_request(
 async def reject_location_share_request(
     request_id: str = Path(..., description="リクエストID"),
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     位置情報共有リクエストを拒否
@@ -453,7 +481,7 @@ async def reject_location_share_request(
 async def revoke_location_share(
     friend_id: str = Path(..., description="共有を停止する相手のUID"),
     current_user: UserInDB = Depends(get_current_user),
-    friend_service: FriendService = Depends(lambda: FriendService()),
+    friend_service: FriendService = Depends(get_friend_service),
 ):
     """
     位置情報共有を停止
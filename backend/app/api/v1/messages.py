@@ -7,6 +7,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
 
 from app.api.dependencies import get_current_user
+from app.api.serialization import model_json_response
 from app.schemas.message import (
     ConversationListResponse,
     MessageCreate,
@@ -20,12 +21,20 @@ from app.services.messages import MessageService
 
 router = APIRouter()
 
+def get_message_service() -> MessageService:
+    """メッセージサービスのDIプロバイダ
+
+    名前付きの依存関係にしておくことで、テストからapp.dependency_overridesで
+    差し替えられます（クラスのパッチやアプリの再構築は不要）。
+    """
+    return MessageService()
+
 
 @router.post("", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
 async def send_message(
     message_data: MessageCreate,
     current_user: UserInDB = Depends(get_current_user),
-    message_service: MessageService = Depends(lambda: MessageService()),
+    message_service: MessageService = Depends(get_message_service),
 ):
     """
     メッセージを送信
@@ -54,7 +63,7 @@ async def send_message(
 @router.get("/conversations", response_model=ConversationListResponse)
 async def get_conversations(
     current_user: UserInDB = Depends(get_current_user),
-    message_service: MessageService = Depends(lambda: MessageService()),
+    message_service: MessageService = Depends(get_message_service),
 ):
     """
     会話一覧を取得
@@ -70,7 +79,12 @@ async def get_conversations(
         会話一覧
     """
     conversations = await message_service.get_conversations(current_user.uid)
-    return ConversationListResponse(conversations=conversations, total=len(conversations))
+    # サービス層で検証済みの行をmodel_constructの封筒に包み、再検証せずシリアライズする
+    return model_json_response(
+        ConversationListResponse.model_construct(
+            conversations=conversations, total=len(conversations)
+        )
+    )
 
 
 @router.get("/conversations/{other_user_id}/messages", response_model=MessageListResponse)
@@ -79,7 +93,7 @@ async def get_conversation_messages(
     limit: int = Query(50, ge=1, le=100, description="取得件数"),
     before_message_id: Optional[str] = Query(None, description="このメッセージIDより前のメッセージを取得"),
     current_user: UserInDB = Depends(get_current_user),
-    message_service: MessageService = Depends(lambda: MessageService()),
+    message_service: MessageService = Depends(get_message_service),
 ):
     """
     会話のメッセージ一覧を取得
@@ -111,7 +125,11 @@ async def get_conversation_messages(
         # さらにメッセージがあるかチェック
         has_more = len(messages) == limit
 
-        return MessageListResponse(messages=messages, total=len(messages), has_more=has_more)
+        return model_json_response(
+            MessageListResponse.model_construct(
+                messages=messages, total=len(messages), has_more=has_more
+            )
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -120,7 +138,7 @@ async def get_conversation_messages(
 async def reveal_messages(
     reveal_data: MessageRevealRequest,
     current_user: UserInDB = Depends(get_current_user),
-    message_service: MessageService = Depends(lambda: MessageService()),
+    message_service: MessageService = Depends(get_message_service),
 ):
     """
     メッセージを表示（受信者が表示を選択）
@@ -152,7 +170,7 @@ async def reveal_messages(
 async def mark_messages_as_read(
     read_data: MessageMarkReadRequest,
     current_user: UserInDB = Depends(get_current_user),
-    message_service: MessageService = Depends(lambda: MessageService()),
+    message_service: MessageService = Depends(get_message_service),
 ):
     """
     メッセージを既読にする
@@ -184,7 +202,7 @@ async def mark_messages_as_read(
 async def delete_message(
     message_id: str = Path(..., description="削除するメッセージID"),
     current_user: UserInDB = Depends(get_current_user),
-    message_service: MessageService = Depends(lambda: MessageService()),
+    message_service: MessageService = Depends(get_message_service),
 ):
     """
     メッセージを削除
@@ -209,7 +227,7 @@ async def delete_message(
 @router.get("/unread-count", response_model=dict)
 async def get_unread_count(
     current_user: UserInDB = Depends(get_current_user),
-    message_service: MessageService = Depends(lambda: MessageService()),
+    message_service: MessageService = Depends(get_message_service),
 ):
     """
     未読メッセージの総数を取得
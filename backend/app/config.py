@@ -18,6 +18,9 @@ class Settings(BaseSettings):
     # 暗号化設定
     ENCRYPTION_KEY: str
 
+    # 住所変更制限（日数）
+    LOCATION_CHANGE_LOCK_DAYS: int = 90
+
     class Config:
         env_file = ".env"
         case_sensitive = True
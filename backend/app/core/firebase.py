@@ -1,3 +1,6 @@
+import asyncio
+from functools import lru_cache
+
 import firebase_admin
 from firebase_admin import credentials, firestore, auth, storage
 from app.config import settings
@@ -15,8 +18,13 @@ def initialize_firebase():
             'projectId': settings.FIREBASE_PROJECT_ID,
         })
 
+@lru_cache(maxsize=None)
 def get_firestore_client():
-    """Firestoreクライアント取得"""
+    """Firestoreクライアント取得
+
+    サービスはリクエストごとに生成されるため、クライアントは
+    プロセス内で1度だけ構築してキャッシュする。
+    """
     return firestore.client()
 
 def get_auth_client():
@@ -26,3 +34,13 @@ def get_auth_client():
 def get_storage_client():
     """Firebase Storage クライアント取得"""
     return storage
+
+async def run_blocking(fn, *args, **kwargs):
+    """
+    同期SDK呼び出しをワーカースレッドで実行
+
+    firebase_admin / google-cloud-firestore のSDKは同期APIのため、
+    asyncハンドラから直接呼ぶとRPCの間イベントループ全体がブロックされます。
+    asyncio.to_threadで逃がして他のコルーチンを進行させます。
+    """
+    return await asyncio.to_thread(fn, *args, **kwargs)
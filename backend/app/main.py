@@ -1,13 +1,34 @@
+from contextlib import asynccontextmanager
+
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import auth, friends, messages, notifications, users
 from app.core.firebase import initialize_firebase
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 外部HTTP呼び出し用の共有クライアント
+    # リクエストごとに生成するとTCP/TLSハンドシェイクを毎回払うことになるため、
+    # アプリ起動時に1つ構築してコネクションプールを使い回す
+    app.state.http = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=100,
+            keepalive_expiry=30.0,
+        )
+    )
+    yield
+    await app.state.http.aclose()
+
+
 app = FastAPI(
     title="Generic API Template",
     description="Reusable FastAPI backend with Auth, Messaging, Friends, and Notifications",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS設定
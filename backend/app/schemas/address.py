@@ -0,0 +1,63 @@
+"""
+住所関連のPydanticスキーマ定義
+
+住所変更リクエスト、カスタム場所、特別な住所変更申請のスキーマを定義します。
+"""
+
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class AddressType(str, Enum):
+    """住所タイプ"""
+
+    HOME = "home"
+    WORK = "work"
+
+
+class AddressChangeReason(str, Enum):
+    """特別な住所変更申請の理由"""
+
+    MOVING = "moving"  # 引っ越し
+    JOB_CHANGE = "job_change"  # 転職
+    OTHER = "other"  # その他
+
+
+class AddressUpdateRequest(BaseModel):
+    """住所更新リクエスト"""
+
+    latitude: float = Field(..., ge=-90, le=90, description="緯度")
+    longitude: float = Field(..., ge=-180, le=180, description="経度")
+
+
+class CustomLocationCreate(BaseModel):
+    """カスタム場所の作成リクエスト"""
+
+    name: str = Field(..., min_length=1, max_length=50)
+    latitude: float = Field(..., ge=-90, le=90, description="緯度")
+    longitude: float = Field(..., ge=-180, le=180, description="経度")
+    radius_meters: int = Field(default=100, ge=10, le=1000)
+    color: str = Field(default="#9C27B0", description="表示色（HEX）")
+
+
+class CustomLocationUpdate(BaseModel):
+    """カスタム場所の更新リクエスト"""
+
+    name: Optional[str] = Field(None, min_length=1, max_length=50)
+    latitude: Optional[float] = Field(None, ge=-90, le=90, description="緯度")
+    longitude: Optional[float] = Field(None, ge=-180, le=180, description="経度")
+    radius_meters: Optional[int] = Field(None, ge=10, le=1000)
+    color: Optional[str] = Field(None, description="表示色（HEX）")
+
+
+class SpecialAddressChangeRequest(BaseModel):
+    """特別な住所変更申請（90日制限内の変更、運営の承認が必要）"""
+
+    address_type: AddressType
+    new_latitude: float = Field(..., ge=-90, le=90, description="新しい緯度")
+    new_longitude: float = Field(..., ge=-180, le=180, description="新しい経度")
+    reason: AddressChangeReason
+    description: str = Field(..., min_length=1, max_length=500, description="申請理由の詳細")
+    document_url: Optional[str] = Field(None, description="証明書類のURL")
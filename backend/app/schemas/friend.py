@@ -99,7 +99,7 @@ class FriendRequestResponse(BaseModel):
     from_user_display_name: Optional[str] = None
     from_user_profile_image_url: Optional[str] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class FriendRequestAcceptReject(BaseModel):
@@ -153,7 +153,7 @@ class FriendshipResponse(BaseModel):
     friend_email: Optional[str] = None
     friend_profile_image_url: Optional[str] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class FriendshipUpdate(BaseModel):
@@ -203,7 +203,7 @@ class LocationShareRequestResponse(BaseModel):
     requester_display_name: Optional[str] = None
     requester_profile_image_url: Optional[str] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LocationShareRequestListResponse(BaseModel):
@@ -104,7 +104,7 @@ class MessageResponse(BaseModel):
     sender_display_name: Optional[str] = None
     sender_profile_image_url: Optional[str] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class MessageListResponse(BaseModel):
@@ -147,7 +147,7 @@ class ConversationResponse(BaseModel):
     participant_display_name: Optional[str] = None
     participant_profile_image_url: Optional[str] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ConversationListResponse(BaseModel):
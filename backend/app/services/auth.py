@@ -6,9 +6,15 @@ from datetime import UTC, datetime
 from typing import Optional, Dict, Any
 from firebase_admin import auth, firestore
 from firebase_admin.exceptions import FirebaseError
-from app.core.firebase import get_firestore_client, get_auth_client
+from app.core.firebase import get_firestore_client, get_auth_client, run_blocking
 from app.schemas.auth import SignupRequest, LoginRequest, TokenResponse
 from app.schemas.user import UserInDB, UserCreate
+from app.services.users import (
+    cache_user,
+    get_cached_user,
+    hydrate_user,
+    invalidate_user_cache,
+)
 from app.utils.jwt import create_access_token, get_token_expire_time
 
 
@@ -35,7 +41,8 @@ class AuthService:
         """
         try:
             # 1. Firebase Authenticationでユーザー作成
-            user_record = self.auth_client.create_user(
+            user_record = await run_blocking(
+                self.auth_client.create_user,
                 email=request.email,
                 password=request.password,
                 display_name=request.display_name
@@ -50,8 +57,15 @@ class AuthService:
                 updated_at=datetime.now(UTC)
             )
 
+            # mode='python'でdatetimeをそのまま渡し、FirestoreにネイティブのTimestampとして保存する
+            # （mode='json'だとISO文字列になり、タイムスタンプでの範囲クエリができなくなる）
+            # created_at/updated_atはサーバー側で原子的に採番する
+            user_dict = user_data.model_dump(mode='python')
+            user_dict['created_at'] = firestore.SERVER_TIMESTAMP
+            user_dict['updated_at'] = firestore.SERVER_TIMESTAMP
+
             user_ref = self.db.collection('users').document(user_record.uid)
-            user_ref.set(user_data.model_dump(mode='json'))
+            await run_blocking(user_ref.set, user_dict)
 
             # 3. JWTトークンを生成
             access_token = create_access_token(
@@ -85,13 +99,13 @@ class AuthService:
         """
         try:
             # Firebase IDトークンを検証
-            decoded_token = self.auth_client.verify_id_token(id_token)
+            decoded_token = await run_blocking(self.auth_client.verify_id_token, id_token)
             uid = decoded_token['uid']
             email = decoded_token.get('email')
 
             # Firestoreからユーザー情報を取得
             user_ref = self.db.collection('users').document(uid)
-            user_doc = user_ref.get()
+            user_doc = await run_blocking(user_ref.get)
 
             if not user_doc.exists:
                 raise ValueError("ユーザーが見つかりません")
@@ -123,14 +137,19 @@ class AuthService:
         Returns:
             ユーザー情報、存在しない場合はNone
         """
+        cached = get_cached_user(uid)
+        if cached is not None:
+            return cached
+
         user_ref = self.db.collection('users').document(uid)
-        user_doc = user_ref.get()
+        user_doc = await run_blocking(user_ref.get)
 
         if not user_doc.exists:
             return None
 
-        user_data = user_doc.to_dict()
-        return UserInDB(**user_data)
+        user = hydrate_user(user_doc.to_dict())
+        cache_user(uid, user)
+        return user
 
     async def delete_user(self, uid: str) -> bool:
         """
@@ -144,10 +163,11 @@ class AuthService:
         """
         try:
             # Firebase Authenticationからユーザー削除
-            self.auth_client.delete_user(uid)
+            await run_blocking(self.auth_client.delete_user, uid)
 
             # Firestoreからユーザー情報削除
-            self.db.collection('users').document(uid).delete()
+            await run_blocking(self.db.collection('users').document(uid).delete)
+            invalidate_user_cache(uid)
 
             return True
 
@@ -169,9 +189,10 @@ class AuthService:
             user_ref = self.db.collection('users').document(uid)
 
             # fcm_tokensに追加（重複を避ける）
-            user_ref.update({
+            await run_blocking(user_ref.update, {
                 'fcm_tokens': firestore.ArrayUnion([fcm_token])
             })
+            invalidate_user_cache(uid)
 
             return True
 
@@ -192,9 +213,10 @@ class AuthService:
         try:
             user_ref = self.db.collection('users').document(uid)
 
-            user_ref.update({
+            await run_blocking(user_ref.update, {
                 'fcm_tokens': firestore.ArrayRemove([fcm_token])
             })
+            invalidate_user_cache(uid)
 
             return True
 
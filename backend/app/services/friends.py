@@ -5,9 +5,11 @@
 from datetime import UTC, datetime
 from typing import List, Optional
 
+from firebase_admin import firestore
+from google.api_core.exceptions import NotFound
 from google.cloud.firestore_v1 import FieldFilter
 
-from app.core.firebase import get_firestore_client
+from app.core.firebase import get_firestore_client, run_blocking
 from app.schemas.friend import (
     FriendRequestCreate,
     FriendRequestResponse,
@@ -22,6 +24,15 @@ from app.schemas.friend import (
 )
 from app.services.users import UserService
 
+# ホットパスのクエリ構築で毎回Enum属性 + .value を引かないよう、
+# 値文字列をモジュール定数に展開しておく
+_PENDING = FriendRequestStatus.PENDING.value
+_ACCEPTED = FriendRequestStatus.ACCEPTED.value
+_REJECTED = FriendRequestStatus.REJECTED.value
+_ACTIVE = FriendshipStatus.ACTIVE.value
+_BLOCKED = FriendshipStatus.BLOCKED.value
+_TRUST_LEVEL_FRIEND = TrustLevel.FRIEND.value
+
 
 class FriendService:
     """フレンド管理サービスクラス"""
@@ -30,6 +41,79 @@ class FriendService:
         self.db = get_firestore_client()
         self.user_service = UserService()
 
+    def _friendship_doc_id(self, user_id: str, friend_id: str) -> str:
+        """
+        フレンド関係のドキュメントIDを生成（内部メソッド）
+
+        会話IDと同じく、ソート済みUIDペアから決定的なIDを作ります。
+        1ペアにつき1ドキュメントのみ存在します。
+
+        Args:
+            user_id: ユーザーID
+            friend_id: フレンドID
+
+        Returns:
+            フレンド関係のドキュメントID
+        """
+        sorted_ids = sorted([user_id, friend_id])
+        return f"{sorted_ids[0]}_{sorted_ids[1]}"
+
+    def _friendship_view(
+        self, data: dict, user_id: str, friend_id: str
+    ) -> Optional[FriendshipInDB]:
+        """
+        正規化ドキュメントからuser_id視点のフレンド関係を構築（内部メソッド）
+
+        friendshipsドキュメントは1ペア1件で、方向ごとの属性
+        （位置共有可否・ニックネーム・ステータス）をUIDキーのマップで持ちます。
+
+        Args:
+            data: friendshipsドキュメントのデータ
+            user_id: 視点となるユーザーID
+            friend_id: フレンドID
+
+        Returns:
+            user_id視点のフレンド関係、この方向がactiveでない場合はNone
+        """
+        status = data.get("status", {}).get(user_id)
+        if status != _ACTIVE:
+            return None
+
+        return FriendshipInDB.model_construct(
+            friendship_id=data["friendship_id"],
+            user_id=user_id,
+            friend_id=friend_id,
+            can_see_friend_location=data.get("can_see_friend_location", {}).get(user_id, False),
+            nickname=data.get("nickname", {}).get(user_id),
+            status=status,
+            created_at=data["created_at"],
+            updated_at=data["updated_at"],
+            trust_level=data.get("trust_level", {}).get(user_id, _TRUST_LEVEL_FRIEND),
+        )
+
+    def _get_users_by_uids(self, uids: List[str]) -> dict:
+        """
+        複数ユーザーの表示用情報を一括取得（内部メソッド）
+
+        一覧系APIでユーザーごとに1回ずつ取得するとN+1問題になるため、
+        get_all()で1回のバッチ読み取りにまとめます。
+
+        Args:
+            uids: ユーザーIDのリスト
+
+        Returns:
+            {uid: ユーザーデータdict} の辞書（存在しないユーザーは含まない）
+        """
+        if not uids:
+            return {}
+
+        refs = [self.db.collection("users").document(uid) for uid in set(uids)]
+        user_docs = self.db.get_all(
+            refs, field_paths=["display_name", "email", "profile_image_url"]
+        )
+
+        return {doc.id: doc.to_dict() for doc in user_docs if doc.exists}
+
     async def send_friend_request(
         self, from_user_id: str, request_data: FriendRequestCreate
     ) -> FriendRequestResponse:
@@ -62,32 +146,34 @@ class FriendService:
             raise ValueError("既にフレンドです")
 
         # 既存のpendingリクエストがないかチェック
-        existing_requests = (
-            self.db.collection("friend_requests")
-            .where(filter=FieldFilter("from_user_id", "==", from_user_id))
-            .where(filter=FieldFilter("to_user_id", "==", to_user_id))
-            .where(filter=FieldFilter("status", "==", FriendRequestStatus.PENDING.value))
-            .get()
+        # (from, to, pending)は業務ルール上一意なので決定的なドキュメントIDを使い、
+        # インデックス付きクエリではなく主キーGETで存在判定する
+        request_ref = self.db.collection("friend_requests").document(
+            f"{from_user_id}__{to_user_id}__pending"
         )
+        existing_doc = await run_blocking(request_ref.get, field_paths=[])
 
-        if len(list(existing_requests)) > 0:
+        if existing_doc.exists:
             raise ValueError("既にフレンドリクエストを送信済みです")
 
         # リクエストを作成
-        request_ref = self.db.collection("friend_requests").document()
         request_data_dict = {
             "request_id": request_ref.id,
             "from_user_id": from_user_id,
             "to_user_id": to_user_id,
             "message": request_data.message,
-            "status": FriendRequestStatus.PENDING.value,
-            "created_at": datetime.now(UTC),
+            "status": _PENDING,
+            # サーバー側で原子的にタイムスタンプを採番（クロックスキューを防ぐ）
+            "created_at": firestore.SERVER_TIMESTAMP,
             "responded_at": None,
         }
 
-        request_ref.set(request_data_dict)
+        await run_blocking(request_ref.set, request_data_dict)
 
-        return FriendRequestResponse(**request_data_dict)
+        # レスポンスにはクライアント時刻を近似値として返す（保存値はサーバー時刻）
+        return FriendRequestResponse.model_construct(
+            **{**request_data_dict, "created_at": datetime.now(UTC)}
+        )
 
     async def get_received_requests(self, user_id: str) -> List[FriendRequestResponse]:
         """
@@ -99,25 +185,32 @@ class FriendService:
         Returns:
             リクエスト一覧
         """
-        requests = (
+        # レスポンスに必要なフィールドだけ射影して転送量を抑える
+        query = (
             self.db.collection("friend_requests")
             .where(filter=FieldFilter("to_user_id", "==", user_id))
-            .where(filter=FieldFilter("status", "==", FriendRequestStatus.PENDING.value))
+            .where(filter=FieldFilter("status", "==", _PENDING))
             .order_by("created_at", direction="DESCENDING")
-            .get()
+            .select(["request_id", "from_user_id", "to_user_id", "message", "status", "created_at"])
         )
+        requests = await run_blocking(list, query.stream())
 
-        result = []
-        for req in requests:
-            req_data = req.to_dict()
+        request_dicts = [req.to_dict() for req in requests]
+
+        # 送信者の情報をまとめて取得（1リクエストずつ取得するとN+1になるため）
+        users_by_uid = await run_blocking(
+            self._get_users_by_uids,
+            [req_data["from_user_id"] for req_data in request_dicts],
+        )
 
-            # 送信者の情報を取得
-            from_user = await self.user_service.get_user_by_uid(req_data["from_user_id"])
+        result = []
+        for req_data in request_dicts:
+            from_user = users_by_uid.get(req_data["from_user_id"])
             if from_user:
-                req_data["from_user_display_name"] = from_user.display_name
-                req_data["from_user_profile_image_url"] = from_user.profile_image_url
+                req_data["from_user_display_name"] = from_user.get("display_name")
+                req_data["from_user_profile_image_url"] = from_user.get("profile_image_url")
 
-            result.append(FriendRequestResponse(**req_data))
+            result.append(FriendRequestResponse.model_construct(**req_data))
 
         return result
 
@@ -131,18 +224,20 @@ class FriendService:
         Returns:
             リクエスト一覧
         """
-        requests = (
+        # レスポンスに必要なフィールドだけ射影して転送量を抑える
+        query = (
             self.db.collection("friend_requests")
             .where(filter=FieldFilter("from_user_id", "==", user_id))
-            .where(filter=FieldFilter("status", "==", FriendRequestStatus.PENDING.value))
+            .where(filter=FieldFilter("status", "==", _PENDING))
             .order_by("created_at", direction="DESCENDING")
-            .get()
+            .select(["request_id", "from_user_id", "to_user_id", "message", "status", "created_at"])
         )
+        requests = await run_blocking(list, query.stream())
 
         result = []
         for req in requests:
             req_data = req.to_dict()
-            result.append(FriendRequestResponse(**req_data))
+            result.append(FriendRequestResponse.model_construct(**req_data))
 
         return result
 
@@ -161,7 +256,7 @@ class FriendService:
             ValueError: リクエストが見つからない、権限がない場合
         """
         request_ref = self.db.collection("friend_requests").document(request_id)
-        request_doc = request_ref.get()
+        request_doc = await run_blocking(request_ref.get)
 
         if not request_doc.exists:
             raise ValueError("リクエストが見つかりません")
@@ -173,30 +268,49 @@ class FriendService:
             raise ValueError("このリクエストを承認する権限がありません")
 
         # ステータスがpendingかチェック
-        if request_data["status"] != FriendRequestStatus.PENDING.value:
+        if request_data["status"] != _PENDING:
             raise ValueError("このリクエストは既に処理済みです")
 
-        # リクエストステータスを更新
-        request_ref.update(
-            {"status": FriendRequestStatus.ACCEPTED.value, "responded_at": datetime.now(UTC)}
+        # リクエスト処理とフレンド関係作成を1つのバッチで原子的にコミット
+        # pendingの決定的IDドキュメントは履歴用の自動採番IDへ移し、
+        # 同じ相手に将来再度リクエストを送れるようにする
+        # フレンド関係は1ペア1ドキュメント（方向ごとの属性はUIDキーのマップで保持）
+        # 位置情報共有はデフォルトでオフ（別途リクエストが必要）
+        batch = self.db.batch()
+        history_ref = self.db.collection("friend_requests").document()
+        batch.set(
+            history_ref,
+            {
+                **request_data,
+                "request_id": history_ref.id,
+                "status": _ACCEPTED,
+                "responded_at": firestore.SERVER_TIMESTAMP,
+            },
         )
+        batch.delete(request_ref)
 
-        # フレンド関係を作成（双方向）
-        # 位置情報共有はデフォルトでオフ（別途リクエストが必要）
-        friendship1 = await self._create_friendship(
-            user_id=request_data["to_user_id"],
-            friend_id=request_data["from_user_id"],
-            can_see_friend_location=False,
+        friendship_ref, friendship_data = self._new_friendship_doc(
+            request_data["to_user_id"], request_data["from_user_id"]
         )
+        batch.set(friendship_ref, friendship_data)
+
+        await run_blocking(batch.commit)
 
-        await self._create_friendship(
-            user_id=request_data["from_user_id"],
-            friend_id=request_data["to_user_id"],
+        # 呼び出し元はIDしか参照しないため、作成済みデータから検証なしで直接ビューを構築する
+        # （タイムスタンプはクライアント時刻の近似値、保存値はサーバー時刻）
+        now = datetime.now(UTC)
+        return FriendshipInDB.model_construct(
+            friendship_id=friendship_ref.id,
+            user_id=request_data["to_user_id"],
+            friend_id=request_data["from_user_id"],
             can_see_friend_location=False,
+            nickname=None,
+            status=_ACTIVE,
+            created_at=now,
+            updated_at=now,
+            trust_level=_TRUST_LEVEL_FRIEND,
         )
 
-        return friendship1
-
     async def reject_friend_request(self, user_id: str, request_id: str) -> None:
         """
         フレンドリクエストを拒否
@@ -209,7 +323,7 @@ class FriendService:
             ValueError: リクエストが見つからない、権限がない場合
         """
         request_ref = self.db.collection("friend_requests").document(request_id)
-        request_doc = request_ref.get()
+        request_doc = await run_blocking(request_ref.get)
 
         if not request_doc.exists:
             raise ValueError("リクエストが見つかりません")
@@ -221,80 +335,106 @@ class FriendService:
             raise ValueError("このリクエストを拒否する権限がありません")
 
         # ステータスがpendingかチェック
-        if request_data["status"] != FriendRequestStatus.PENDING.value:
+        if request_data["status"] != _PENDING:
             raise ValueError("このリクエストは既に処理済みです")
 
-        # リクエストステータスを更新
-        request_ref.update(
-            {"status": FriendRequestStatus.REJECTED.value, "responded_at": datetime.now(UTC)}
+        # pendingの決定的IDドキュメントを履歴用の自動採番IDへ移す
+        # （同じ相手に将来再度リクエストを送れるようにする）
+        batch = self.db.batch()
+        history_ref = self.db.collection("friend_requests").document()
+        batch.set(
+            history_ref,
+            {
+                **request_data,
+                "request_id": history_ref.id,
+                "status": _REJECTED,
+                "responded_at": firestore.SERVER_TIMESTAMP,
+            },
         )
+        batch.delete(request_ref)
+        await run_blocking(batch.commit)
 
-    async def _create_friendship(
-        self,
-        user_id: str,
-        friend_id: str,
-        can_see_friend_location: bool = False,
-        nickname: Optional[str] = None,
-    ) -> FriendshipInDB:
+    def _new_friendship_doc(self, user_id: str, friend_id: str):
         """
-        フレンド関係を作成（内部メソッド）
+        フレンド関係ドキュメントの参照とデータを生成（内部メソッド、書き込みはしない）
 
         Args:
             user_id: ユーザーID
             friend_id: フレンドID
-            can_see_friend_location: このユーザーがフレンドの位置を見られるか
-            nickname: ニックネーム
 
         Returns:
-            作成されたフレンド関係
+            (ドキュメント参照, ドキュメントデータ) のタプル
         """
-        friendship_ref = self.db.collection("friendships").document()
+        doc_id = self._friendship_doc_id(user_id, friend_id)
+        friendship_ref = self.db.collection("friendships").document(doc_id)
         friendship_data = {
-            "friendship_id": friendship_ref.id,
-            "user_id": user_id,
-            "friend_id": friend_id,
-            "can_see_friend_location": can_see_friend_location,
-            "nickname": nickname,
-            "status": FriendshipStatus.ACTIVE.value,
-            "created_at": datetime.now(UTC),
-            "updated_at": datetime.now(UTC),
+            "friendship_id": doc_id,
+            "participants": sorted([user_id, friend_id]),
+            # 方向ごとの属性はUIDキーのマップで保持する
+            "can_see_friend_location": {user_id: False, friend_id: False},
+            "nickname": {user_id: None, friend_id: None},
+            "status": {
+                user_id: _ACTIVE,
+                friend_id: _ACTIVE,
+            },
+            "created_at": firestore.SERVER_TIMESTAMP,
+            "updated_at": firestore.SERVER_TIMESTAMP,
             # 後方互換性のため
-            "trust_level": TrustLevel.FRIEND.value,
+            "trust_level": {
+                user_id: _TRUST_LEVEL_FRIEND,
+                friend_id: _TRUST_LEVEL_FRIEND,
+            },
         }
-
-        friendship_ref.set(friendship_data)
-
-        return FriendshipInDB(**friendship_data)
+        return friendship_ref, friendship_data
 
     async def get_friends(self, user_id: str) -> List[FriendshipResponse]:
         """
         フレンド一覧を取得
 
+        注意: レスポンスは {friends, total} のエンベロープ形式でtotalを
+        返す契約のため、非同期ジェネレータでの逐次返却はしない。
+        Firestore側はstream()で逐次受信し、ユーザー情報は1回のバッチ
+        読み取りにまとめることで全件分のレイテンシを抑えている。
+
         Args:
             user_id: ユーザーID
 
         Returns:
             フレンド一覧
         """
-        friendships = (
+        query = (
             self.db.collection("friendships")
-            .where(filter=FieldFilter("user_id", "==", user_id))
-            .where(filter=FieldFilter("status", "==", FriendshipStatus.ACTIVE.value))
-            .get()
+            .where(filter=FieldFilter("participants", "array_contains", user_id))
+            .where(filter=FieldFilter(f"status.{user_id}", "==", _ACTIVE))
         )
+        friendships = await run_blocking(list, query.stream())
 
-        result = []
+        # user_id視点のビューに変換
+        views = []
         for friendship in friendships:
             friendship_data = friendship.to_dict()
+            participants = friendship_data["participants"]
+            friend_id = participants[1] if participants[0] == user_id else participants[0]
+
+            view = self._friendship_view(friendship_data, user_id, friend_id)
+            if view:
+                views.append(view)
+
+        # フレンドのユーザー情報をまとめて取得（1件ずつ取得するとN+1になるため）
+        users_by_uid = await run_blocking(
+            self._get_users_by_uids, [view.friend_id for view in views]
+        )
 
-            # フレンドのユーザー情報を取得
-            friend = await self.user_service.get_user_by_uid(friendship_data["friend_id"])
+        result = []
+        for view in views:
+            friendship_data = view.model_dump()
+            friend = users_by_uid.get(view.friend_id)
             if friend:
-                friendship_data["friend_display_name"] = friend.display_name
-                friendship_data["friend_email"] = friend.email
-                friendship_data["friend_profile_image_url"] = friend.profile_image_url
+                friendship_data["friend_display_name"] = friend.get("display_name")
+                friendship_data["friend_email"] = friend.get("email")
+                friendship_data["friend_profile_image_url"] = friend.get("profile_image_url")
 
-            result.append(FriendshipResponse(**friendship_data))
+            result.append(FriendshipResponse.model_construct(**friendship_data))
 
         return result
 
@@ -309,20 +449,15 @@ class FriendService:
         Returns:
             フレンド関係、存在しない場合はNone
         """
-        friendships = (
-            self.db.collection("friendships")
-            .where(filter=FieldFilter("user_id", "==", user_id))
-            .where(filter=FieldFilter("friend_id", "==", friend_id))
-            .where(filter=FieldFilter("status", "==", FriendshipStatus.ACTIVE.value))
-            .limit(1)
-            .get()
+        friendship_ref = self.db.collection("friendships").document(
+            self._friendship_doc_id(user_id, friend_id)
         )
+        friendship_doc = await run_blocking(friendship_ref.get)
 
-        friendship_list = list(friendships)
-        if not friendship_list:
+        if not friendship_doc.exists:
             return None
 
-        return FriendshipInDB(**friendship_list[0].to_dict())
+        return self._friendship_view(friendship_doc.to_dict(), user_id, friend_id)
 
     async def is_friend(self, user_id: str, friend_id: str) -> bool:
         """
@@ -359,20 +494,31 @@ class FriendService:
         if not friendship:
             raise ValueError("フレンド関係が見つかりません")
 
-        # 更新データの準備
+        # 更新データの準備（方向ごとの属性はドット記法でマップのキーを更新）
         update_dict = update_data.model_dump(exclude_unset=True, exclude_none=True)
+        field_updates = {"updated_at": firestore.SERVER_TIMESTAMP}
+        if "can_see_friend_location" in update_dict:
+            field_updates[f"can_see_friend_location.{user_id}"] = update_dict[
+                "can_see_friend_location"
+            ]
+        if "nickname" in update_dict:
+            field_updates[f"nickname.{user_id}"] = update_dict["nickname"]
         # 後方互換性のため、trust_levelがあれば値に変換
         if "trust_level" in update_dict and update_dict["trust_level"] is not None:
-            update_dict["trust_level"] = update_dict["trust_level"].value
-        update_dict["updated_at"] = datetime.now(UTC)
+            field_updates[f"trust_level.{user_id}"] = update_dict["trust_level"].value
 
         # Firestoreを更新
         friendship_ref = self.db.collection("friendships").document(friendship.friendship_id)
-        friendship_ref.update(update_dict)
+        await run_blocking(friendship_ref.update, field_updates)
 
-        # 更新後のデータを取得
-        updated_doc = friendship_ref.get()
-        return FriendshipInDB(**updated_doc.to_dict())
+        # 再読込せず、取得済みのビューに更新内容をローカルでマージして返す
+        view_updates = {
+            key: update_dict[key]
+            for key in ("can_see_friend_location", "nickname", "trust_level")
+            if key in update_dict
+        }
+        view_updates["updated_at"] = datetime.now(UTC)
+        return friendship.model_copy(update=view_updates)
 
     async def remove_friend(self, user_id: str, friend_id: str) -> None:
         """
@@ -385,21 +531,17 @@ class FriendService:
         Raises:
             ValueError: フレンド関係が見つからない場合
         """
-        # user_id -> friend_id の関係を削除
-        friendship1 = await self.get_friendship(user_id, friend_id)
-        if friendship1:
-            friendship1_ref = self.db.collection("friendships").document(friendship1.friendship_id)
-            friendship1_ref.delete()
-
-        # friend_id -> user_id の関係を削除
-        friendship2 = await self.get_friendship(friend_id, user_id)
-        if friendship2:
-            friendship2_ref = self.db.collection("friendships").document(friendship2.friendship_id)
-            friendship2_ref.delete()
+        # 1ペア1ドキュメントなので削除は1件で済む
+        friendship_ref = self.db.collection("friendships").document(
+            self._friendship_doc_id(user_id, friend_id)
+        )
+        friendship_doc = await run_blocking(friendship_ref.get)
 
-        if not friendship1 and not friendship2:
+        if not friendship_doc.exists:
             raise ValueError("フレンド関係が見つかりません")
 
+        await run_blocking(friendship_ref.delete)
+
     async def block_user(self, user_id: str, friend_id: str) -> None:
         """
         ユーザーをブロック
@@ -408,12 +550,20 @@ class FriendService:
             user_id: ユーザーID
             friend_id: ブロックするユーザーID
         """
-        friendship = await self.get_friendship(user_id, friend_id)
-        if friendship:
-            friendship_ref = self.db.collection("friendships").document(friendship.friendship_id)
-            friendship_ref.update(
-                {"status": FriendshipStatus.BLOCKED.value, "updated_at": datetime.now(UTC)}
+        friendship_ref = self.db.collection("friendships").document(
+            self._friendship_doc_id(user_id, friend_id)
+        )
+        try:
+            await run_blocking(
+                friendship_ref.update,
+                {
+                    f"status.{user_id}": _BLOCKED,
+                    "updated_at": firestore.SERVER_TIMESTAMP,
+                },
             )
+        except NotFound:
+            # フレンド関係がない場合は何もしない（従来挙動を維持）
+            pass
 
     async def get_trust_level(self, user_id: str, friend_id: str) -> Optional[TrustLevel]:
         """
@@ -485,15 +635,17 @@ class FriendService:
             raise ValueError("既に位置情報を見ることができます")
 
         # 既存のpendingリクエストがないかチェック
-        existing_requests = (
+        # limit(1)で1件だけ取得し、存在判定のための全件取得を避ける
+        query = (
             self.db.collection("location_share_requests")
             .where(filter=FieldFilter("requester_id", "==", requester_id))
             .where(filter=FieldFilter("target_id", "==", target_id))
-            .where(filter=FieldFilter("status", "==", FriendRequestStatus.PENDING.value))
-            .get()
+            .where(filter=FieldFilter("status", "==", _PENDING))
+            .limit(1)
         )
+        existing_requests = await run_blocking(query.get)
 
-        if len(list(existing_requests)) > 0:
+        if next(iter(existing_requests), None) is not None:
             raise ValueError("既に位置情報共有リクエストを送信済みです")
 
         # リクエストを作成
@@ -502,14 +654,18 @@ class FriendService:
             "request_id": request_ref.id,
             "requester_id": requester_id,
             "target_id": target_id,
-            "status": FriendRequestStatus.PENDING.value,
-            "created_at": datetime.now(UTC),
+            "status": _PENDING,
+            # サーバー側で原子的にタイムスタンプを採番（クロックスキューを防ぐ）
+            "created_at": firestore.SERVER_TIMESTAMP,
             "responded_at": None,
         }
 
-        request_ref.set(request_data_dict)
+        await run_blocking(request_ref.set, request_data_dict)
 
-        return LocationShareRequestResponse(**request_data_dict)
+        # レスポンスにはクライアント時刻を近似値として返す（保存値はサーバー時刻）
+        return LocationShareRequestResponse.model_construct(
+            **{**request_data_dict, "created_at": datetime.now(UTC)}
+        )
 
     async def get_received_location_share_requests(
         self, user_id: str
@@ -523,25 +679,32 @@ class FriendService:
         Returns:
             リクエスト一覧
         """
-        requests = (
+        # レスポンスに必要なフィールドだけ射影して転送量を抑える
+        query = (
             self.db.collection("location_share_requests")
             .where(filter=FieldFilter("target_id", "==", user_id))
-            .where(filter=FieldFilter("status", "==", FriendRequestStatus.PENDING.value))
+            .where(filter=FieldFilter("status", "==", _PENDING))
             .order_by("created_at", direction="DESCENDING")
-            .get()
+            .select(["request_id", "requester_id", "target_id", "status", "created_at"])
         )
+        requests = await run_blocking(list, query.stream())
 
-        result = []
-        for req in requests:
-            req_data = req.to_dict()
+        request_dicts = [req.to_dict() for req in requests]
+
+        # リクエスト送信者の情報をまとめて取得
+        users_by_uid = await run_blocking(
+            self._get_users_by_uids,
+            [req_data["requester_id"] for req_data in request_dicts],
+        )
 
-            # リクエスト送信者の情報を取得
-            requester = await self.user_service.get_user_by_uid(req_data["requester_id"])
+        result = []
+        for req_data in request_dicts:
+            requester = users_by_uid.get(req_data["requester_id"])
             if requester:
-                req_data["requester_display_name"] = requester.display_name
-                req_data["requester_profile_image_url"] = requester.profile_image_url
+                req_data["requester_display_name"] = requester.get("display_name")
+                req_data["requester_profile_image_url"] = requester.get("profile_image_url")
 
-            result.append(LocationShareRequestResponse(**req_data))
+            result.append(LocationShareRequestResponse.model_construct(**req_data))
 
         return result
 
@@ -557,18 +720,20 @@ class FriendService:
         Returns:
             リクエスト一覧
         """
-        requests = (
+        # レスポンスに必要なフィールドだけ射影して転送量を抑える
+        query = (
             self.db.collection("location_share_requests")
             .where(filter=FieldFilter("requester_id", "==", user_id))
-            .where(filter=FieldFilter("status", "==", FriendRequestStatus.PENDING.value))
+            .where(filter=FieldFilter("status", "==", _PENDING))
             .order_by("created_at", direction="DESCENDING")
-            .get()
+            .select(["request_id", "requester_id", "target_id", "status", "created_at"])
         )
+        requests = await run_blocking(list, query.stream())
 
         result = []
         for req in requests:
             req_data = req.to_dict()
-            result.append(LocationShareRequestResponse(**req_data))
+            result.append(LocationShareRequestResponse.model_construct(**req_data))
 
         return result
 
@@ -587,7 +752,7 @@ class FriendService:
             ValueError: リクエストが見つからない、権限がない場合
         """
         request_ref = self.db.collection("location_share_requests").document(request_id)
-        request_doc = request_ref.get()
+        request_doc = await run_blocking(request_ref.get)
 
         if not request_doc.exists:
             raise ValueError("リクエストが見つかりません")
@@ -599,12 +764,16 @@ class FriendService:
             raise ValueError("このリクエストを承認する権限がありません")
 
         # ステータスがpendingかチェック
-        if request_data["status"] != FriendRequestStatus.PENDING.value:
+        if request_data["status"] != _PENDING:
             raise ValueError("このリクエストは既に処理済みです")
 
         # リクエストステータスを更新
-        request_ref.update(
-            {"status": FriendRequestStatus.ACCEPTED.value, "responded_at": datetime.now(UTC)}
+        await run_blocking(
+            request_ref.update,
+            {
+                "status": _ACCEPTED,
+                "responded_at": firestore.SERVER_TIMESTAMP,
+            },
         )
 
         # フレンド関係を更新（requesterがtargetの位置を見られるようにする）
@@ -615,11 +784,19 @@ class FriendService:
             raise ValueError("フレンド関係が見つかりません")
 
         friendship_ref = self.db.collection("friendships").document(friendship.friendship_id)
-        friendship_ref.update({"can_see_friend_location": True, "updated_at": datetime.now(UTC)})
+        await run_blocking(
+            friendship_ref.update,
+            {
+                f"can_see_friend_location.{request_data['requester_id']}": True,
+                "updated_at": firestore.SERVER_TIMESTAMP,
+            },
+        )
 
         # 更新後のフレンド関係を取得して返す
-        updated_doc = friendship_ref.get()
-        return FriendshipInDB(**updated_doc.to_dict())
+        updated_doc = await run_blocking(friendship_ref.get)
+        return self._friendship_view(
+            updated_doc.to_dict(), request_data["requester_id"], request_data["target_id"]
+        )
 
     async def reject_location_share_request(self, user_id: str, request_id: str) -> None:
         """
@@ -633,7 +810,7 @@ class FriendService:
             ValueError: リクエストが見つからない、権限がない場合
         """
         request_ref = self.db.collection("location_share_requests").document(request_id)
-        request_doc = request_ref.get()
+        request_doc = await run_blocking(request_ref.get)
 
         if not request_doc.exists:
             raise ValueError("リクエストが見つかりません")
@@ -645,12 +822,16 @@ class FriendService:
             raise ValueError("このリクエストを拒否する権限がありません")
 
         # ステータスがpendingかチェック
-        if request_data["status"] != FriendRequestStatus.PENDING.value:
+        if request_data["status"] != _PENDING:
             raise ValueError("このリクエストは既に処理済みです")
 
         # リクエストステータスを更新
-        request_ref.update(
-            {"status": FriendRequestStatus.REJECTED.value, "responded_at": datetime.now(UTC)}
+        await run_blocking(
+            request_ref.update,
+            {
+                "status": _REJECTED,
+                "responded_at": firestore.SERVER_TIMESTAMP,
+            },
         )
 
     async def revoke_location_share(self, user_id: str, viewer_id: str) -> None:
@@ -679,4 +860,10 @@ class FriendService:
 
         # can_see_friend_location を false にする
         friendship_ref = self.db.collection("friendships").document(friendship.friendship_id)
-        friendship_ref.update({"can_see_friend_location": False, "updated_at": datetime.now(UTC)})
+        await run_blocking(
+            friendship_ref.update,
+            {
+                f"can_see_friend_location.{viewer_id}": False,
+                "updated_at": firestore.SERVER_TIMESTAMP,
+            },
+        )
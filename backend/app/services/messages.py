@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 from typing import List, Optional
 
 from google.cloud.firestore_v1 import FieldFilter
+from pydantic import TypeAdapter
 
 from app.core.firebase import get_firestore_client
 from app.schemas.message import (
@@ -17,6 +18,11 @@ from app.schemas.notification import NotificationType
 from app.services.friends import FriendService
 from app.services.users import UserService
 
+# リストレスポンス用のTypeAdapterはモジュールロード時に1度だけ構築する
+# （N件をModel(**d)で個別に検証する代わりに、リスト全体を1回のpydantic-core呼び出しで検証）
+_MESSAGE_LIST_ADAPTER = TypeAdapter(List[MessageResponse])
+_CONVERSATION_LIST_ADAPTER = TypeAdapter(List[ConversationResponse])
+
 
 class MessageService:
     """メッセージングサービスクラス"""
@@ -255,7 +261,7 @@ class MessageService:
         query = query.limit(limit)
         messages = query.get()
 
-        result = []
+        message_dicts = []
         for msg in messages:
             msg_data = msg.to_dict()
 
@@ -271,7 +277,10 @@ class MessageService:
             ):
                 continue
 
-            result.append(MessageResponse(**msg_data))
+            message_dicts.append(msg_data)
+
+        # リスト全体を1回で検証・構築
+        result = _MESSAGE_LIST_ADAPTER.validate_python(message_dicts)
 
         # 新しい順→古い順に並び替え（UIで表示しやすいように）
         result.reverse()
@@ -295,7 +304,7 @@ class MessageService:
             .get()
         )
 
-        result = []
+        conversation_dicts = []
         for conv in conversations:
             conv_data = conv.to_dict()
 
@@ -314,21 +323,22 @@ class MessageService:
             unread_counts = conv_data.get("unread_counts", {})
             my_unread_count = unread_counts.get(user_id, 0)
 
-            conversation_response = ConversationResponse(
-                conversation_id=conv_data["conversation_id"],
-                participant_id=other_user_id,
-                last_message_at=conv_data["last_message_at"],
-                last_message_content=conv_data["last_message_content"],
-                last_message_sender_id=conv_data["last_message_sender_id"],
-                unread_count=my_unread_count,
-                created_at=conv_data["created_at"],
-                participant_display_name=other_user.display_name,
-                participant_profile_image_url=other_user.profile_image_url,
+            conversation_dicts.append(
+                {
+                    "conversation_id": conv_data["conversation_id"],
+                    "participant_id": other_user_id,
+                    "last_message_at": conv_data["last_message_at"],
+                    "last_message_content": conv_data["last_message_content"],
+                    "last_message_sender_id": conv_data["last_message_sender_id"],
+                    "unread_count": my_unread_count,
+                    "created_at": conv_data["created_at"],
+                    "participant_display_name": other_user.display_name,
+                    "participant_profile_image_url": other_user.profile_image_url,
+                }
             )
 
-            result.append(conversation_response)
-
-        return result
+        # リスト全体を1回で検証・構築
+        return _CONVERSATION_LIST_ADAPTER.validate_python(conversation_dicts)
 
     async def reveal_messages(self, user_id: str, message_ids: List[str]) -> int:
         """
@@ -2,8 +2,9 @@
 ユーザー管理サービス
 """
 
+import time
 from datetime import UTC, datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from app.config import settings
 from app.core.firebase import get_firestore_client
@@ -16,6 +17,50 @@ from app.schemas.address import (
 )
 from app.schemas.user import Address, CustomLocation, UserInDB, UserUpdate
 
+# ユーザードキュメントのプロセス内TTLキャッシュ
+# 認証ミドルウェアや一覧系APIが同じユーザーを短時間に繰り返し読むため、
+# 短いTTLでFirestoreの読み取りを削減する
+_USER_CACHE_TTL_SECONDS = 30
+_USER_CACHE_MAX_SIZE = 10_000
+_user_cache: Dict[str, Tuple[float, UserInDB]] = {}
+
+
+def get_cached_user(uid: str) -> Optional[UserInDB]:
+    """キャッシュからユーザーを取得（期限切れ・未登録の場合はNone）"""
+    entry = _user_cache.get(uid)
+    if entry is None:
+        return None
+
+    cached_at, user = entry
+    if time.monotonic() - cached_at >= _USER_CACHE_TTL_SECONDS:
+        _user_cache.pop(uid, None)
+        return None
+
+    return user
+
+
+def hydrate_user(user_data: Dict) -> UserInDB:
+    """FirestoreドキュメントからUserInDBを構築
+
+    キャッシュはUserServiceとAuthServiceで共有しているため、投入前の構築は
+    必ずこの関数を通す。ネストしたAddress / CustomLocationを変換するには
+    完全な検証が必要で、model_constructでは代用できない。
+    """
+    return UserInDB(**user_data)
+
+
+def cache_user(uid: str, user: UserInDB) -> None:
+    """ユーザーをキャッシュに登録（hydrate_userで検証済みのインスタンスのみ渡すこと）"""
+    if len(_user_cache) >= _USER_CACHE_MAX_SIZE:
+        # サイズ上限に達したら全クリア（TTLが短いため実害はない）
+        _user_cache.clear()
+    _user_cache[uid] = (time.monotonic(), user)
+
+
+def invalidate_user_cache(uid: str) -> None:
+    """ユーザーのキャッシュを無効化（更新・削除時に呼ぶ）"""
+    _user_cache.pop(uid, None)
+
 
 class UserService:
     """ユーザー管理サービスクラス"""
@@ -33,14 +78,19 @@ class UserService:
         Returns:
             ユーザー情報、存在しない場合はNone
         """
+        cached = get_cached_user(uid)
+        if cached is not None:
+            return cached
+
         user_ref = self.db.collection("users").document(uid)
         user_doc = user_ref.get()
 
         if not user_doc.exists:
             return None
 
-        user_data = user_doc.to_dict()
-        return UserInDB(**user_data)
+        user = hydrate_user(user_doc.to_dict())
+        cache_user(uid, user)
+        return user
 
     async def update_profile(self, uid: str, update_data: UserUpdate) -> UserInDB:
         """
@@ -68,6 +118,7 @@ class UserService:
 
         # Firestoreを更新
         user_ref.update(update_dict)
+        invalidate_user_cache(uid)
 
         # 更新後のユーザー情報を取得
         return await self.get_user_by_uid(uid)
@@ -142,6 +193,7 @@ class UserService:
         user_ref.update(
             {field_name: new_address.model_dump(mode="json"), "updated_at": datetime.now(UTC)}
         )
+        invalidate_user_cache(uid)
 
         return await self.get_user_by_uid(uid)
 
@@ -228,6 +280,7 @@ class UserService:
                 "updated_at": datetime.now(UTC),
             }
         )
+        invalidate_user_cache(uid)
 
         return await self.get_user_by_uid(uid)
 
@@ -270,6 +323,7 @@ class UserService:
                 "updated_at": datetime.now(UTC),
             }
         )
+        invalidate_user_cache(uid)
 
         return await self.get_user_by_uid(uid)
 
@@ -305,6 +359,7 @@ class UserService:
                 "updated_at": datetime.now(UTC),
             }
         )
+        invalidate_user_cache(uid)
 
         return await self.get_user_by_uid(uid)
 
@@ -4,29 +4,105 @@ pytest設定とフィクスチャ定義
 
 from datetime import datetime
 from typing import Dict, List
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 
-from app.main import app
+from app.main import app as fastapi_app
 from app.schemas.user import Address, UserInDB
 
 
-@pytest.fixture
-def client(sample_user1):
+@pytest.fixture(scope="session")
+def app():
+    """
+    FastAPIアプリケーション（セッションスコープ）
+
+    ルーター構築やOpenAPIスキーマ生成はテストごとに繰り返す必要がないため、
+    セッション全体で1つのインスタンスを共有する。
+    """
+    return fastapi_app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """
+    FastAPI TestClient（セッションスコープ）
+
+    アプリ構成は全テストで同一のため、クライアントもセッション全体で
+    1つを共有する。構成の異なるアプリが必要になった場合は、ハッシュ可能な
+    設定タプルをキーにしたキャッシュ付きファクトリに分ける。
+    認証やサービスの差し替えは app.dependency_overrides で行う。
+    リクエストごとのイベントループ処理を軽くするため、uvloopバックエンドで動かす。
     """
-    FastAPI TestClient with dependency overrides
+    with TestClient(app, backend_options={"use_uvloop": True}) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def async_client(app):
+    """ASGITransport直結の非同期HTTPクライアント
+
+    TestClientはリクエストごとにワーカースレッドへ処理を逃がすが、
+    こちらはアプリをテストと同じイベントループで直接呼び出すため
+    スレッドホップが発生しない。
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+# AsyncMockの生成は子モック・コルーチンラッパーの配線を伴い比較的重いため、
+# テストごとに作り直さず1つをリセットして使い回す
+_message_service_mock = AsyncMock()
+_friend_service_mock = AsyncMock()
+
+
+@pytest.fixture
+def mock_message_service(app):
+    """MessageServiceをAsyncMockに差し替える
+
+    dependency_overrides経由で注入するため、クラスのパッチと違って
+    テストごとにサービスやクライアントを再構築する必要がない。
     """
+    from app.api.v1.messages import get_message_service
+
+    service = _message_service_mock
+    service.reset_mock(return_value=True, side_effect=True)
+    app.dependency_overrides[get_message_service] = lambda: service
+
+    yield service
+
+    app.dependency_overrides.pop(get_message_service, None)
+
+
+@pytest.fixture
+def mock_friend_service(app):
+    """FriendServiceをAsyncMockに差し替える（mock_message_serviceと同じ方式）"""
+    from app.api.v1.friends import get_friend_service
+
+    service = _friend_service_mock
+    service.reset_mock(return_value=True, side_effect=True)
+    app.dependency_overrides[get_friend_service] = lambda: service
+
+    yield service
+
+    app.dependency_overrides.pop(get_friend_service, None)
+
+
+@pytest.fixture(autouse=True)
+def override_current_user(app, sample_user1):
+    """認証をバイパスし、テスト後にdependency_overridesをリセットする"""
     from app.api.dependencies import get_current_user
 
-    async def override_get_current_user():
+    async def _override_get_current_user():
         return sample_user1
 
-    app.dependency_overrides[get_current_user] = override_get_current_user
+    app.dependency_overrides[get_current_user] = _override_get_current_user
 
-    client = TestClient(app)
-    yield client
+    yield
 
     # クリーンアップ
     app.dependency_overrides.clear()
@@ -39,9 +115,9 @@ def mock_firestore_client():
     return mock_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_user1() -> UserInDB:
-    """テスト用ユーザー1"""
+    """テスト用ユーザー1（読み取り専用・セッション全体で共有）"""
     return UserInDB(
         uid="test_user_1",
         email="user1@example.com",
@@ -61,9 +137,9 @@ def sample_user1() -> UserInDB:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_user2() -> UserInDB:
-    """テスト用ユーザー2"""
+    """テスト用ユーザー2（読み取り専用・セッション全体で共有）"""
     return UserInDB(
         uid="test_user_2",
         email="user2@example.com",
@@ -83,9 +159,9 @@ def sample_user2() -> UserInDB:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_user3() -> UserInDB:
-    """テスト用ユーザー3"""
+    """テスト用ユーザー3（読み取り専用・セッション全体で共有）"""
     return UserInDB(
         uid="test_user_3",
         email="user3@example.com",
@@ -3,188 +3,253 @@
 """
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, patch
 
+import orjson
+import pytest
 from fastapi import status
 
-from app.schemas.message import MessageContentType
+from app.schemas.message import ConversationResponse, MessageContentType, MessageResponse
+
+# 列挙型メンバーの属性参照を繰り返さないよう、モジュールスコープに束縛しておく
+_TEXT = MessageContentType.TEXT
+
+# アサーションのたびにstatusモジュールを参照しないよう、1度だけ束縛する
+_OK = status.HTTP_200_OK
+_CREATED = status.HTTP_201_CREATED
+_NO_CONTENT = status.HTTP_204_NO_CONTENT
+_BAD_REQUEST = status.HTTP_400_BAD_REQUEST
+_FORBIDDEN = status.HTTP_403_FORBIDDEN
+
+# テストごとに時計を読む必要はないため、タイムスタンプは固定値を共有する
+_NOW = datetime(2024, 1, 1, 0, 0, 0, tzinfo=UTC)
+
+# conftestのsample_user1 / sample_user2に対応する会話ID
+_CONV_ID = "test_user_1_test_user_2"
+
+# リクエストボディはテストごとに再シリアライズせず、一度だけバイト列にしておく
+_JSON_HEADERS = {"content-type": "application/json"}
+_SEND_BODY = orjson.dumps(
+    {"recipient_id": "test_user_2", "content": "こんにちは！", "content_type": "text"}
+)
+_REVEAL_BODY = orjson.dumps({"message_ids": ["msg_1", "msg_2", "msg_3"]})
+_READ_BODY = orjson.dumps({"message_ids": ["msg_1", "msg_2"]})
 
 
 class TestMessageEndpoints:
     """メッセージ関連エンドポイントのテスト"""
 
-    def test_send_message(self, client, sample_user1, sample_user2):
+    async def test_send_message(
+        self, async_client, sample_user1, sample_user2, mock_message_service
+    ):
         """メッセージ送信エンドポイント"""
-        mock_message_service = AsyncMock()
-        mock_message_service.send_message.return_value = AsyncMock(
+        # デフォルト値のフィールドは渡さず、必須フィールドのみmodel_constructで組み立てる
+        mock_message_service.send_message.return_value = MessageResponse.model_construct(
             message_id="message_123",
-            conversation_id=f"{sample_user1.uid}_{sample_user2.uid}",
+            conversation_id=_CONV_ID,
             sender_id=sample_user1.uid,
             recipient_id=sample_user2.uid,
             content="こんにちは！",
-            content_type=MessageContentType.TEXT,
+            content_type=_TEXT,
             is_visible_to_recipient=False,
             is_read=False,
-            created_at=datetime.now(UTC),
-            read_at=None,
-            revealed_at=None,
+            created_at=_NOW,
             sender_display_name=sample_user1.display_name,
-            sender_profile_image_url=None,
         )
 
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.post(
-                "/api/v1/messages",
-                json={
-                    "recipient_id": sample_user2.uid,
-                    "content": "こんにちは！",
-                    "content_type": "text",
-                },
-            )
-
-            assert response.status_code == status.HTTP_201_CREATED
-            data = response.json()
-            assert data["message_id"] == "message_123"
-            assert data["sender_id"] == sample_user1.uid
-            assert data["recipient_id"] == sample_user2.uid
-            assert data["content"] == "こんにちは！"
-            assert data["is_visible_to_recipient"] is False
-            assert data["is_read"] is False
-
-    def test_send_message_to_self_error(self, client):
-        """自分自身へのメッセージ送信はエラー"""
-        mock_message_service = AsyncMock()
-        mock_message_service.send_message.side_effect = ValueError(
-            "自分自身にメッセージを送信できません"
+        response = await async_client.post(
+            "/api/v1/messages", content=_SEND_BODY, headers=_JSON_HEADERS
         )
 
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.post(
+        assert response.status_code == _CREATED
+        data = orjson.loads(response.content)
+        assert data["message_id"] == "message_123"
+        assert data["sender_id"] == sample_user1.uid
+        assert data["recipient_id"] == sample_user2.uid
+        assert data["content"] == "こんにちは！"
+        assert data["is_visible_to_recipient"] is False
+        assert data["is_read"] is False
+
+    @pytest.mark.parametrize(
+        ("service_method", "http_method", "url", "payload", "error_message", "expected_status"),
+        [
+            pytest.param(
+                "send_message",
+                "post",
                 "/api/v1/messages",
-                json={"recipient_id": "test_user_1", "content": "test"},
-            )
-
-            assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_send_message_to_non_friend_error(self, client, sample_user2):
-        """フレンドでないユーザーへのメッセージ送信はエラー"""
-        mock_message_service = AsyncMock()
-        mock_message_service.send_message.side_effect = ValueError(
-            "メッセージを送信するにはフレンドである必要があります"
-        )
-
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.post(
+                orjson.dumps({"recipient_id": "test_user_1", "content": "test"}),
+                "自分自身にメッセージを送信できません",
+                _BAD_REQUEST,
+                id="send-to-self",
+            ),
+            pytest.param(
+                "send_message",
+                "post",
                 "/api/v1/messages",
-                json={"recipient_id": sample_user2.uid, "content": "test"},
-            )
-
-            assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_send_message_non_existent_recipient_error(self, client, sample_user2):
-        """存在しない受信者へのメッセージ送信はエラー"""
-        mock_message_service = AsyncMock()
-        mock_message_service.send_message.side_effect = ValueError(
-            "指定された受信者が見つかりません"
-        )
-
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.post(
+                orjson.dumps({"recipient_id": "test_user_2", "content": "test"}),
+                "メッセージを送信するにはフレンドである必要があります",
+                _BAD_REQUEST,
+                id="send-to-non-friend",
+            ),
+            pytest.param(
+                "send_message",
+                "post",
                 "/api/v1/messages",
-                json={"recipient_id": sample_user2.uid, "content": "test"},
-            )
-
-            assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_get_conversations(self, client, sample_user1, sample_user2):
+                orjson.dumps({"recipient_id": "test_user_2", "content": "test"}),
+                "指定された受信者が見つかりません",
+                _BAD_REQUEST,
+                id="send-to-non-existent-recipient",
+            ),
+            pytest.param(
+                "reveal_messages",
+                "post",
+                "/api/v1/messages/reveal",
+                orjson.dumps({"message_ids": ["msg_1"]}),
+                "このメッセージを表示する権限がありません",
+                _FORBIDDEN,
+                id="reveal-permission",
+            ),
+            pytest.param(
+                "mark_messages_as_read",
+                "post",
+                "/api/v1/messages/read",
+                orjson.dumps({"message_ids": ["msg_1"]}),
+                "このメッセージを既読にする権限がありません",
+                _FORBIDDEN,
+                id="mark-read-permission",
+            ),
+            pytest.param(
+                "delete_message",
+                "delete",
+                "/api/v1/messages/nonexistent_message",
+                None,
+                "メッセージが見つかりません",
+                _BAD_REQUEST,
+                id="delete-not-found",
+            ),
+            pytest.param(
+                "delete_message",
+                "delete",
+                "/api/v1/messages/msg_123",
+                None,
+                "このメッセージを削除する権限がありません",
+                _BAD_REQUEST,
+                id="delete-permission",
+            ),
+        ],
+    )
+    async def test_error_responses(
+        self,
+        async_client,
+        mock_message_service,
+        service_method,
+        http_method,
+        url,
+        payload,
+        error_message,
+        expected_status,
+    ):
+        """サービス層のValueErrorが適切なHTTPステータスに変換される"""
+        getattr(mock_message_service, service_method).side_effect = ValueError(error_message)
+
+        kwargs = {"content": payload, "headers": _JSON_HEADERS} if payload is not None else {}
+        response = await getattr(async_client, http_method)(url, **kwargs)
+
+        assert response.status_code == expected_status
+
+    async def test_get_conversations(
+        self, async_client, sample_user1, sample_user2, mock_message_service
+    ):
         """会話一覧取得"""
-        mock_message_service = AsyncMock()
         mock_message_service.get_conversations.return_value = [
-            AsyncMock(
-                conversation_id=f"{sample_user1.uid}_{sample_user2.uid}",
+            ConversationResponse(
+                conversation_id=_CONV_ID,
                 participant_id=sample_user2.uid,
-                last_message_at=datetime.now(UTC),
+                last_message_at=_NOW,
                 last_message_content="最後のメッセージ",
                 last_message_sender_id=sample_user2.uid,
                 unread_count=3,
-                created_at=datetime.now(UTC),
+                created_at=_NOW,
                 participant_display_name=sample_user2.display_name,
                 participant_profile_image_url=None,
             )
         ]
 
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.get("/api/v1/messages/conversations")
+        response = await async_client.get("/api/v1/messages/conversations")
 
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert "conversations" in data
-            assert "total" in data
-            assert data["total"] == 1
-            assert data["conversations"][0]["unread_count"] == 3
+        assert response.status_code == _OK
+        data = orjson.loads(response.content)
+        assert "conversations" in data
+        assert "total" in data
+        assert data["total"] == 1
+        assert data["conversations"][0]["unread_count"] == 3
 
-    def test_get_conversation_messages(self, client, sample_user1, sample_user2):
+    async def test_get_conversation_messages(
+        self, async_client, sample_user1, sample_user2, mock_message_service
+    ):
         """会話のメッセージ一覧取得"""
-        mock_message_service = AsyncMock()
         mock_message_service.get_conversation_messages.return_value = [
-            AsyncMock(
+            MessageResponse(
                 message_id="msg_1",
-                conversation_id=f"{sample_user1.uid}_{sample_user2.uid}",
+                conversation_id=_CONV_ID,
                 sender_id=sample_user2.uid,
                 recipient_id=sample_user1.uid,
                 content="メッセージ1",
-                content_type=MessageContentType.TEXT,
+                content_type=_TEXT,
                 is_visible_to_recipient=True,
                 is_read=True,
-                created_at=datetime.now(UTC),
-                read_at=datetime.now(UTC),
-                revealed_at=datetime.now(UTC),
+                created_at=_NOW,
+                read_at=_NOW,
+                revealed_at=_NOW,
                 sender_display_name=sample_user2.display_name,
                 sender_profile_image_url=None,
             ),
-            AsyncMock(
+            MessageResponse(
                 message_id="msg_2",
-                conversation_id=f"{sample_user1.uid}_{sample_user2.uid}",
+                conversation_id=_CONV_ID,
                 sender_id=sample_user1.uid,
                 recipient_id=sample_user2.uid,
                 content="メッセージ2",
-                content_type=MessageContentType.TEXT,
+                content_type=_TEXT,
                 is_visible_to_recipient=True,
                 is_read=False,
-                created_at=datetime.now(UTC),
+                created_at=_NOW,
                 read_at=None,
-                revealed_at=datetime.now(UTC),
+                revealed_at=_NOW,
                 sender_display_name=sample_user1.display_name,
                 sender_profile_image_url=None,
             ),
         ]
 
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.get(f"/api/v1/messages/conversations/{sample_user2.uid}/messages")
-
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert "messages" in data
-            assert "total" in data
-            assert "has_more" in data
-            assert data["total"] == 2
-            assert data["messages"][0]["message_id"] == "msg_1"
-            assert data["messages"][1]["message_id"] == "msg_2"
+        response = await async_client.get(
+            f"/api/v1/messages/conversations/{sample_user2.uid}/messages"
+        )
 
-    def test_get_conversation_messages_with_pagination(self, client, sample_user2):
+        assert response.status_code == _OK
+        data = orjson.loads(response.content)
+        assert "messages" in data
+        assert "total" in data
+        assert "has_more" in data
+        assert data["total"] == 2
+        assert data["messages"][0]["message_id"] == "msg_1"
+        assert data["messages"][1]["message_id"] == "msg_2"
+
+    async def test_get_conversation_messages_with_pagination(
+        self, async_client, sample_user2, mock_message_service
+    ):
         """会話のメッセージ一覧取得（ページネーション）"""
-        mock_message_service = AsyncMock()
+        # 50件分のモックはバリデーション済みの値しか持たないため、model_constructで
+        # フィールド検証を飛ばして生成する
         mock_message_service.get_conversation_messages.return_value = [
-            AsyncMock(
+            MessageResponse.model_construct(
                 message_id=f"msg_{i}",
                 conversation_id="conv_123",
                 sender_id=sample_user2.uid,
                 recipient_id="test_user_1",
                 content=f"メッセージ{i}",
-                content_type=MessageContentType.TEXT,
+                content_type=_TEXT,
                 is_visible_to_recipient=True,
                 is_read=False,
-                created_at=datetime.now(UTC),
+                created_at=_NOW,
                 read_at=None,
                 revealed_at=None,
                 sender_display_name=sample_user2.display_name,
@@ -193,131 +258,66 @@ class TestMessageEndpoints:
             for i in range(50)
         ]
 
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.get(
-                f"/api/v1/messages/conversations/{sample_user2.uid}/messages"
-                "?limit=50&before_message_id=msg_100"
-            )
+        response = await async_client.get(
+            f"/api/v1/messages/conversations/{sample_user2.uid}/messages"
+            "?limit=50&before_message_id=msg_100"
+        )
 
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["total"] == 50
-            assert data["has_more"] is True  # limitと同じ数なのでさらにある可能性
+        assert response.status_code == _OK
+        data = orjson.loads(response.content)
+        assert data["total"] == 50
+        assert data["has_more"] is True  # limitと同じ数なのでさらにある可能性
 
-    def test_reveal_messages(self, client):
+    async def test_reveal_messages(self, async_client, mock_message_service):
         """メッセージ表示エンドポイント"""
-        mock_message_service = AsyncMock()
         mock_message_service.reveal_messages.return_value = 3
 
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.post(
-                "/api/v1/messages/reveal",
-                json={"message_ids": ["msg_1", "msg_2", "msg_3"]},
-            )
-
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["count"] == 3
-            assert "メッセージを表示しました" in data["message"]
-
-    def test_reveal_messages_permission_error(self, client):
-        """メッセージ表示時の権限エラー"""
-        mock_message_service = AsyncMock()
-        mock_message_service.reveal_messages.side_effect = ValueError(
-            "このメッセージを表示する権限がありません"
+        response = await async_client.post(
+            "/api/v1/messages/reveal", content=_REVEAL_BODY, headers=_JSON_HEADERS
         )
 
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.post(
-                "/api/v1/messages/reveal",
-                json={"message_ids": ["msg_1"]},
-            )
-
-            assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.status_code == _OK
+        data = orjson.loads(response.content)
+        assert data["count"] == 3
+        assert "メッセージを表示しました" in data["message"]
 
-    def test_mark_messages_as_read(self, client):
+    async def test_mark_messages_as_read(self, async_client, mock_message_service):
         """メッセージ既読エンドポイント"""
-        mock_message_service = AsyncMock()
         mock_message_service.mark_messages_as_read.return_value = 2
 
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.post(
-                "/api/v1/messages/read",
-                json={"message_ids": ["msg_1", "msg_2"]},
-            )
-
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["count"] == 2
-            assert "既読にしました" in data["message"]
-
-    def test_mark_messages_as_read_permission_error(self, client):
-        """メッセージ既読時の権限エラー"""
-        mock_message_service = AsyncMock()
-        mock_message_service.mark_messages_as_read.side_effect = ValueError(
-            "このメッセージを既読にする権限がありません"
+        response = await async_client.post(
+            "/api/v1/messages/read", content=_READ_BODY, headers=_JSON_HEADERS
         )
 
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.post(
-                "/api/v1/messages/read",
-                json={"message_ids": ["msg_1"]},
-            )
-
-            assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.status_code == _OK
+        data = orjson.loads(response.content)
+        assert data["count"] == 2
+        assert "既読にしました" in data["message"]
 
-    def test_delete_message(self, client):
+    async def test_delete_message(self, async_client, mock_message_service):
         """メッセージ削除エンドポイント"""
-        mock_message_service = AsyncMock()
         mock_message_service.delete_message.return_value = None
 
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.delete("/api/v1/messages/msg_123")
-
-            assert response.status_code == status.HTTP_204_NO_CONTENT
-
-    def test_delete_message_not_found(self, client):
-        """存在しないメッセージ削除はエラー"""
-        mock_message_service = AsyncMock()
-        mock_message_service.delete_message.side_effect = ValueError("メッセージが見つかりません")
-
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.delete("/api/v1/messages/nonexistent_message")
-
-            assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_delete_message_permission_error(self, client):
-        """他人のメッセージ削除はエラー"""
-        mock_message_service = AsyncMock()
-        mock_message_service.delete_message.side_effect = ValueError(
-            "このメッセージを削除する権限がありません"
-        )
-
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.delete("/api/v1/messages/msg_123")
+        response = await async_client.delete("/api/v1/messages/msg_123")
 
-            assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.status_code == _NO_CONTENT
 
-    def test_get_unread_count(self, client):
+    async def test_get_unread_count(self, async_client, mock_message_service):
         """未読メッセージ総数取得"""
-        mock_message_service = AsyncMock()
         mock_message_service.get_unread_message_count.return_value = 5
 
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.get("/api/v1/messages/unread-count")
+        response = await async_client.get("/api/v1/messages/unread-count")
 
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["unread_count"] == 5
+        assert response.status_code == _OK
+        data = orjson.loads(response.content)
+        assert data["unread_count"] == 5
 
-    def test_get_unread_count_zero(self, client):
+    async def test_get_unread_count_zero(self, async_client, mock_message_service):
         """未読メッセージがない場合"""
-        mock_message_service = AsyncMock()
         mock_message_service.get_unread_message_count.return_value = 0
 
-        with patch("app.api.v1.messages.MessageService", return_value=mock_message_service):
-            response = client.get("/api/v1/messages/unread-count")
+        response = await async_client.get("/api/v1/messages/unread-count")
 
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["unread_count"] == 0
+        assert response.status_code == _OK
+        data = orjson.loads(response.content)
+        assert data["unread_count"] == 0